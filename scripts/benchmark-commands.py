@@ -0,0 +1,481 @@
+#!/usr/bin/env python3
+"""
+Benchmark router commands and database views at several dataset scales.
+
+For each scale a fresh database is created from lib/sql/schema.sql and
+filled by generate-scale-data.py. Every read-only COMMAND_MAP entry in
+router.py is then timed end to end (as Claude runs it), along with direct
+queries on the ready_tasks, blocked_tasks and epic_progress views. Commands
+that write state or reach GitHub are listed as skipped.
+
+Each command reports median_ms, its end-to-end latency, and net_ms, the
+same latency minus a probe that pays only router's fixed cost: a parent
+interpreter importing router.py plus a child interpreter importing
+helpers.py. net_ms is what the script does after startup (opening the
+database, querying, formatting). The 50ms target and the baseline gate use
+net_ms, falling back to median_ms if the probe fails.
+Trigger cost is measured directly: a task status update, a task insert and
+a dependency insert are each timed inside a rolled-back transaction.
+
+Results are written as JSON. With --baseline, any timing that regresses past
+the tolerance makes the script exit 1, so it can gate CI.
+
+Usage:
+    benchmark-commands.py [--scales EPICSxTASKS,...] [--repeat N]
+                          [--output FILE] [--baseline FILE] [--tolerance F]
+
+Examples:
+    # Record a baseline
+    benchmark-commands.py --scales 10x10,100x100 --output bench/baseline.json
+
+    # Compare against it (exit 1 on regression)
+    benchmark-commands.py --scales 10x10,100x100 --baseline bench/baseline.json
+
+    # Full ROADMAP 5.3 run: 1k epics / 100k tasks
+    benchmark-commands.py --scales 1000x100 --repeat 3
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = Path(os.environ.get('PLUGIN_DIR', SCRIPT_DIR.parent))
+ROUTER_DIR = PROJECT_ROOT / 'lib' / 'python' / 'scripts'
+ROUTER = ROUTER_DIR / 'router.py'
+HELPERS_DIR = PROJECT_ROOT / 'lib' / 'python'
+SCHEMA_PATH = PROJECT_ROOT / 'lib' / 'sql' / 'schema.sql'
+GENERATOR = SCRIPT_DIR / 'generate-scale-data.py'
+
+SAMPLE_EPIC = 'scale-00000'
+
+# Arguments for commands that need a target: {epic} is SAMPLE_EPIC and
+# {task} the id of its first task, both created by generate-scale-data.py
+COMMAND_ARGS = {
+    'prd-parse': ['{epic}'],
+    'prd-edit': ['{epic}'],
+    'prd-status': ['{epic}'],
+    'epic-decompose': ['{epic}'],
+    'epic-oneshot': ['{epic}'],
+    'epic-show': ['{epic}'],
+    'epic-close': ['{epic}'],
+    'epic-edit': ['{epic}'],
+    'epic-refresh': ['{epic}'],
+    'epic-start': ['{epic}'],
+    'epic-merge': ['{epic}'],
+    'epic-parallel': ['{epic}'],
+    'task-add': ['{epic}'],
+    'task-start': ['{task}'],
+    'task-close': ['{task}'],
+    'task-show': ['{task}'],
+    'issue-show': ['{task}'],
+    'issue-start': ['{task}'],
+    'issue-close': ['{task}'],
+    'issue-reopen': ['{task}'],
+    'issue-edit': ['{task}'],
+    'issue-analyze': ['{task}'],
+    'search': ['cache'],
+}
+
+# Read-only commands; these are the only ones timed end to end. epic-status
+# and issue-status are absent on purpose: they have no script behind them
+# (see docs/investigations/router_implementation_complete.md).
+READ_ONLY_COMMANDS = {
+    'status', 'next', 'blocked', 'in-progress', 'standup',
+    'prd-list', 'prd-status',
+    'epic-list', 'epic-show', 'epic-parallel',
+    'task-show', 'issue-show',
+    'validate', 'search',
+}
+
+# Commands that change state, call an LLM workflow, or touch GitHub or the
+# working tree. Timing them repeatedly against the same database is not
+# meaningful, so they are reported as skipped rather than run. Anything in
+# COMMAND_MAP that is in neither set is skipped as unclassified.
+SKIP_COMMANDS = {
+    'prd-new', 'prd-parse', 'prd-edit',
+    'epic-decompose', 'epic-oneshot', 'epic-close', 'epic-edit',
+    'epic-merge', 'epic-refresh', 'epic-start',
+    'task-add', 'task-start', 'task-close',
+    'issue-start', 'issue-close', 'issue-reopen', 'issue-edit', 'issue-analyze',
+    'github-sync', 'sync', 'epic-sync', 'issue-sync', 'import', 'clean',
+}
+
+VIEW_QUERIES = {
+    'ready_tasks': "SELECT * FROM ready_tasks",
+    'blocked_tasks': "SELECT * FROM blocked_tasks",
+    'epic_progress': "SELECT * FROM epic_progress",
+}
+
+# Trigger-firing writes on the sample epic, each run inside a transaction
+# that is rolled back so the dataset is identical for every repeat.
+# {first}/{last} are the sample epic's first and last task ids.
+WRITE_QUERIES = {
+    'task_status_update': """
+        UPDATE tasks
+        SET status = CASE WHEN status = 'completed' THEN 'in_progress' ELSE 'completed' END,
+            updated_at = datetime('now')
+        WHERE id = {first}
+    """,
+    'task_insert': """
+        INSERT INTO tasks (epic_id, number, title, description, status, created_at, updated_at)
+        SELECT epic_id, MAX(number) + 1, 'Benchmark task', '', 'pending',
+               datetime('now'), datetime('now')
+        FROM tasks WHERE epic_id = (SELECT epic_id FROM tasks WHERE id = {first})
+    """,
+    # Backwards edge: the generator only creates forward ones, so it is new
+    'dependency_insert': """
+        INSERT INTO task_dependencies (task_id, depends_on_task_id) VALUES ({first}, {last})
+    """,
+}
+
+TARGET_MS = 50
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {value}')
+    return number
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark CCPM commands and views')
+    parser.add_argument('--scales', default='10x10,100x10,100x100',
+                        help='Comma-separated EPICSxTASKS_PER_EPIC list (default: 10x10,100x10,100x100)')
+    parser.add_argument('--repeat', type=positive_int, default=5,
+                        help='Runs per command/query (default: 5)')
+    parser.add_argument('--dep-density', type=float, default=0.3,
+                        help='Passed through to the generator (default: 0.3)')
+    parser.add_argument('--conflict-density', type=float, default=0.05,
+                        help='Passed through to the generator (default: 0.05)')
+    parser.add_argument('--commands', help='Comma-separated subset of commands to run')
+    parser.add_argument('--output', help='Write JSON results to this file (default: stdout)')
+    parser.add_argument('--baseline', help='Compare against a previous JSON result')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Allowed relative slowdown vs baseline (default: 0.25)')
+    parser.add_argument('--min-delta-ms', type=float, default=5.0,
+                        help='Ignore regressions smaller than this (default: 5ms)')
+    parser.add_argument('--keep-db', action='store_true',
+                        help='Keep generated databases for inspection')
+    return parser.parse_args(argv)
+
+
+def parse_scales(spec):
+    scales = []
+    for item in spec.split(','):
+        epics, _, tasks = item.strip().lower().partition('x')
+        if not epics.isdigit() or not tasks.isdigit():
+            raise ValueError(f"Invalid scale '{item}' (expected EPICSxTASKS, e.g. 100x10)")
+        if int(epics) < 1 or int(tasks) < 1:
+            raise ValueError(f"Invalid scale '{item}' (epics and tasks must be at least 1)")
+        scales.append((int(epics), int(tasks)))
+    return scales
+
+
+def load_command_map():
+    sys.path.insert(0, str(ROUTER_DIR))
+    import router
+    return dict(router.COMMAND_MAP)
+
+
+def summarize(samples_ms):
+    ordered = sorted(samples_ms)
+    p95_index = max(0, int(round(0.95 * len(ordered))) - 1)
+    return {
+        'median_ms': round(statistics.median(ordered), 2),
+        'p95_ms': round(ordered[p95_index], 2),
+        'min_ms': round(ordered[0], 2),
+        'runs': len(ordered),
+    }
+
+
+def build_database(db_path, epics, tasks_per_epic, args):
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, str(GENERATOR), '--db', db_path, '--quiet', '--init-schema',
+         '--epics', str(epics), '--tasks-per-epic', str(tasks_per_epic),
+         '--dep-density', str(args.dep_density),
+         '--conflict-density', str(args.conflict_density)],
+        check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    return round(time.perf_counter() - start, 2)
+
+
+def sample_tasks(db_path):
+    """Return the first and last task ids of SAMPLE_EPIC."""
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute("""
+            SELECT MIN(t.id), MAX(t.id) FROM tasks t JOIN epics e ON e.id = t.epic_id
+            WHERE e.name = ?
+        """, (SAMPLE_EPIC,)).fetchone()
+    finally:
+        conn.close()
+    return row
+
+
+def timing(stats):
+    """Value compared against the target and baseline: net_ms for commands, else median_ms."""
+    return stats.get('net_ms', stats['median_ms'])
+
+
+def router_overhead(env, repeat):
+    """Median cost of a COMMAND_MAP call that does no work.
+
+    Mirrors what router.py pays before a script runs: a parent interpreter
+    that imports router, then a child interpreter that imports helpers and
+    exits. Subtracting it leaves the script's own database and formatting work.
+    """
+    child = f"import sys; sys.path.insert(0, {str(HELPERS_DIR)!r}); import helpers"
+    probe = (f"import subprocess, sys; sys.path.insert(0, {str(ROUTER_DIR)!r}); import router; "
+             f"sys.exit(subprocess.call([sys.executable, '-c', {child!r}]))")
+    samples = []
+    failure = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', probe], env=env,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        samples.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0 and failure is None:
+            failure = (result.stderr.strip().splitlines()[-1:] or [f'exit {result.returncode}'])[0]
+    stats = summarize(samples)
+    if failure:
+        stats['error'] = failure
+    return stats
+
+
+def time_command(command, argv, env, repeat):
+    samples = []
+    failure = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, str(ROUTER), command] + argv,
+                                env=env, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, text=True)
+        samples.append((time.perf_counter() - start) * 1000)
+        if result.returncode != 0 and failure is None:
+            failure = (result.stderr.strip().splitlines()[-1:] or [f'exit {result.returncode}'])[0]
+    stats = summarize(samples)
+    if failure:
+        # Timings of failed runs are kept for reference but never compared
+        stats['error'] = failure
+    return stats
+
+
+def time_views(db_path, repeat):
+    results = {}
+    conn = sqlite3.connect(db_path)
+    try:
+        for view, sql in VIEW_QUERIES.items():
+            samples = []
+            rows = 0
+            for _ in range(repeat):
+                start = time.perf_counter()
+                rows = len(conn.execute(sql).fetchall())
+                samples.append((time.perf_counter() - start) * 1000)
+            results[view] = dict(summarize(samples), rows=rows)
+    finally:
+        conn.close()
+    return results
+
+
+def time_writes(db_path, first, last, repeat):
+    results = {}
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        for name, sql in WRITE_QUERIES.items():
+            if name == 'dependency_insert' and first == last:
+                continue
+            sql = sql.format(first=first, last=last)
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                conn.execute('BEGIN')
+                conn.execute(sql)
+                samples.append((time.perf_counter() - start) * 1000)
+                conn.execute('ROLLBACK')
+            results[name] = summarize(samples)
+    finally:
+        conn.close()
+    return results
+
+
+def run_scale(epics, tasks_per_epic, commands, args, workdir):
+    label = f'{epics}x{tasks_per_epic}'
+    db_path = str(Path(workdir) / f'ccpm-{label}.db')
+    print(f"Scale {label}: generating {epics * tasks_per_epic} tasks...", file=sys.stderr)
+    load_seconds = build_database(db_path, epics, tasks_per_epic, args)
+
+    env = dict(os.environ, CCPM_DB_PATH=db_path, PLUGIN_DIR=str(PROJECT_ROOT))
+    first_task, last_task = sample_tasks(db_path)
+    targets = {'epic': SAMPLE_EPIC, 'task': first_task}
+    overhead = router_overhead(env, args.repeat)
+    if 'error' in overhead:
+        print(f"⚠️  Router overhead probe failed ({overhead['error']}); "
+              "reporting end-to-end times only", file=sys.stderr)
+
+    command_results = {}
+    skipped = {}
+    for command in commands:
+        if command in SKIP_COMMANDS:
+            skipped[command] = 'writes state'
+            continue
+        if command not in READ_ONLY_COMMANDS:
+            skipped[command] = 'unclassified'
+            continue
+        argv = [a.format(**targets) for a in COMMAND_ARGS.get(command, [])]
+        stats = time_command(command, argv, env, args.repeat)
+        if 'error' not in overhead:
+            stats['net_ms'] = round(max(0.0, stats['median_ms'] - overhead['median_ms']), 2)
+        command_results[command] = stats
+        net = f"  ({stats['net_ms']:.1f} ms net)" if 'net_ms' in stats else ''
+        print(f"  {command:<16} {stats['median_ms']:>8.1f} ms{net}", file=sys.stderr)
+
+    return label, {
+        'epics': epics,
+        'tasks': epics * tasks_per_epic,
+        'load_seconds': load_seconds,
+        'router_overhead': overhead,
+        'commands': command_results,
+        'views': time_views(db_path, args.repeat),
+        'writes': time_writes(db_path, first_task, last_task, args.repeat),
+        'skipped': skipped,
+    }
+
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Return a list of human-readable regressions against ``baseline``."""
+    regressions = []
+    for label, scale in results['scales'].items():
+        base_scale = baseline.get('scales', {}).get(label)
+        if not base_scale:
+            continue
+        for group in ('commands', 'views', 'writes'):
+            for name, stats in scale[group].items():
+                base = base_scale.get(group, {}).get(name)
+                if not base:
+                    continue
+                if 'error' in stats:
+                    if 'error' not in base:
+                        regressions.append(f"{label} {name}: now fails ({stats['error']})")
+                    continue
+                if 'error' in base:
+                    continue
+                before, after = timing(base), timing(stats)
+                if after - before > min_delta_ms and after > before * (1 + tolerance):
+                    change = f"+{(after / before - 1) * 100:.0f}%" if before else 'was 0ms'
+                    regressions.append(
+                        f"{label} {name}: {before:.1f}ms -> {after:.1f}ms ({change})")
+    return regressions
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    for required in (ROUTER, SCHEMA_PATH, GENERATOR):
+        if not required.exists():
+            print(f"❌ Not found: {required}", file=sys.stderr)
+            return 1
+
+    try:
+        scales = parse_scales(args.scales)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    # Fail before generating data, which can take hours at large scales
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = json.loads(Path(args.baseline).read_text())
+        except OSError as e:
+            print(f"❌ Cannot read baseline {args.baseline}: {e.strerror}", file=sys.stderr)
+            return 1
+        except json.JSONDecodeError as e:
+            print(f"❌ Invalid baseline JSON in {args.baseline}: {e}", file=sys.stderr)
+            return 1
+        if not isinstance(baseline, dict) or not isinstance(baseline.get('scales'), dict):
+            print(f"❌ Invalid baseline {args.baseline}: missing 'scales'", file=sys.stderr)
+            return 1
+
+    commands = sorted(load_command_map())
+    if args.commands:
+        wanted = set(args.commands.split(','))
+        unknown = wanted - set(commands)
+        if unknown:
+            print(f"❌ Unknown command(s): {', '.join(sorted(unknown))}", file=sys.stderr)
+            return 1
+        commands = [c for c in commands if c in wanted]
+
+    results = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'repeat': args.repeat,
+        'target_ms': TARGET_MS,
+        'scales': {},
+    }
+
+    workdir = tempfile.mkdtemp(prefix='ccpm-bench-')
+    try:
+        for epics, tasks_per_epic in scales:
+            label, data = run_scale(epics, tasks_per_epic, commands, args, workdir)
+            results['scales'][label] = data
+    except subprocess.CalledProcessError as e:
+        detail = (e.stderr or '').strip().splitlines()[-1:] or [f'exit {e.returncode}']
+        print(f"❌ Data generation failed: {detail[0]}", file=sys.stderr)
+        return 1
+    finally:
+        if args.keep_db:
+            print(f"Databases kept in {workdir}", file=sys.stderr)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    payload = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(payload + '\n')
+        print(f"✓ Results written to {args.output}", file=sys.stderr)
+    else:
+        print(payload)
+
+    over_target = [f"{label} {name}" for label, scale in results['scales'].items()
+                   for group in ('commands', 'views', 'writes')
+                   for name, stats in scale[group].items()
+                   if 'error' not in stats and timing(stats) > TARGET_MS]
+    failed = [f"{label} {name}" for label, scale in results['scales'].items()
+              for name, stats in scale['commands'].items() if 'error' in stats]
+    if failed:
+        print(f"⚠️  Failed command(s): {', '.join(failed)}", file=sys.stderr)
+
+    unclassified = sorted({c for scale in results['scales'].values()
+                           for c, reason in scale['skipped'].items() if reason == 'unclassified'})
+    if unclassified:
+        print(f"⚠️  Skipped unclassified command(s): {', '.join(unclassified)}", file=sys.stderr)
+
+    if over_target:
+        print(f"⚠️  Over {TARGET_MS}ms target: {', '.join(over_target)}", file=sys.stderr)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print("❌ Regressions vs baseline:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print("✓ No regressions vs baseline", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
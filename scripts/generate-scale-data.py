@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Generate large synthetic CCPM datasets for performance testing.
+
+Unlike generate-screenshot-data.sh, which starts one Python process per
+entity, this loads everything in a single process through CCPMDatabase and
+inserts tasks, dependencies, conflicts and sync history with executemany.
+
+Task statuses are assigned in dependency order: only tasks whose
+dependencies are all completed can be completed, in progress or ready, and
+each epic's status is derived from its tasks, so the data passes validate.
+
+Usage:
+    generate-scale-data.py [--db PATH] [--epics N] [--tasks-per-epic N]
+                           [--dep-density F] [--conflict-density F]
+                           [--sync-fraction F] [--stale-fraction F] [--seed N]
+
+Examples:
+    # 1k epics / 100k tasks into a throwaway database
+    CCPM_DB_PATH=/tmp/ccpm-scale.db generate-scale-data.py --epics 1000 --tasks-per-epic 100
+
+    # Dense dependency graph for resolver benchmarks
+    generate-scale-data.py --db /tmp/dense.db --epics 50 --tasks-per-epic 200 --dep-density 0.8
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROJECT_ROOT = Path(os.environ.get('PLUGIN_DIR', SCRIPT_DIR.parent))
+
+# Plugin layout first, then the legacy repository layout
+HELPERS_DIR = next((d for d in (PROJECT_ROOT / 'lib' / 'python', PROJECT_ROOT / 'db')
+                    if (d / 'helpers.py').exists()), None)
+SCHEMA_PATH = PROJECT_ROOT / 'lib' / 'sql' / 'schema.sql'
+
+# Unfinished tasks whose dependencies are all completed, and tasks still
+# waiting on at least one dependency
+WORKABLE_STATUSES = (('in_progress', 10), ('ready', 25))
+WAITING_STATUSES = (('pending', 25), ('blocked', 5))
+
+# Per-epic share of workable tasks already completed: a quarter of epics are
+# untouched, a quarter finished, the rest somewhere in between
+EPIC_MATURITY = (0.0, None, None, 1.0)
+
+AREAS = ('api', 'database', 'frontend', 'service', 'tests', 'docs')
+VERBS = ('Implement', 'Refactor', 'Add', 'Migrate', 'Harden', 'Document')
+NOUNS = ('authentication', 'caching layer', 'search index', 'billing flow',
+         'notification queue', 'audit log', 'rate limiter', 'settings page')
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f'must be at least 1, got {value}')
+    return number
+
+
+def fraction(value):
+    number = float(value)
+    if not 0.0 <= number <= 1.0:
+        raise argparse.ArgumentTypeError(f'must be between 0 and 1, got {value}')
+    return number
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Bulk-load synthetic PRDs, epics and tasks for benchmarking')
+    parser.add_argument('--db', default=os.environ.get('CCPM_DB_PATH'),
+                        help='Database path (default: $CCPM_DB_PATH or ~/.claude/ccpm.db)')
+    parser.add_argument('--epics', type=positive_int, default=100,
+                        help='Number of epics (one PRD each, default: 100)')
+    parser.add_argument('--tasks-per-epic', type=positive_int, default=10,
+                        help='Tasks per epic (default: 10)')
+    parser.add_argument('--dep-density', type=fraction, default=0.3,
+                        help='Probability a task depends on earlier tasks (default: 0.3)')
+    parser.add_argument('--max-deps', type=positive_int, default=3,
+                        help='Maximum dependencies per task (default: 3)')
+    parser.add_argument('--conflict-density', type=fraction, default=0.05,
+                        help='Probability a task conflicts with a sibling (default: 0.05)')
+    parser.add_argument('--sync-fraction', type=fraction, default=0.5,
+                        help='Fraction of tasks with sync history (default: 0.5)')
+    parser.add_argument('--stale-fraction', type=fraction, default=0.2,
+                        help='Share of synced tasks changed since last sync, split between '
+                             'local edits, GitHub edits and conflicts (default: 0.2)')
+    parser.add_argument('--seed', type=int, default=42,
+                        help='Random seed for reproducible datasets (default: 42)')
+    parser.add_argument('--prefix', default='scale',
+                        help='Name prefix for generated PRDs/epics (default: scale)')
+    parser.add_argument('--init-schema', action='store_true',
+                        help='Apply lib/sql/schema.sql first (for fresh databases)')
+    parser.add_argument('--quiet', action='store_true', help='Only print the summary line')
+    return parser.parse_args(argv)
+
+
+def weighted_choice(rng, choices):
+    total = sum(weight for _, weight in choices)
+    pick = rng.uniform(0, total)
+    for value, weight in choices:
+        pick -= weight
+        if pick <= 0:
+            return value
+    return choices[-1][0]
+
+
+def plan_dependencies(rng, count, args):
+    """Map task index -> indexes it depends on; edges only point backwards."""
+    deps = {}
+    for i in range(1, count):
+        if rng.random() < args.dep_density:
+            deps[i] = rng.sample(range(i), min(i, rng.randint(1, args.max_deps)))
+    return deps
+
+
+def plan_statuses(rng, count, deps):
+    """Assign statuses in index (topological) order so they respect dependencies."""
+    maturity = rng.choice(EPIC_MATURITY)
+    if maturity is None:
+        maturity = rng.random()
+
+    statuses = []
+    for i in range(count):
+        if any(statuses[d] != 'completed' for d in deps.get(i, ())):
+            statuses.append(weighted_choice(rng, WAITING_STATUSES))
+        elif rng.random() < maturity:
+            statuses.append('completed')
+        elif maturity == 0.0:
+            statuses.append('ready')
+        else:
+            statuses.append(weighted_choice(rng, WORKABLE_STATUSES))
+    return statuses
+
+
+SYNC_STATES = ('local', 'github', 'conflict')
+
+
+def plan_sync(rng, created, args):
+    """Return (last_sync, github_updated, local_updated) or None for an unsynced task.
+
+    Stale rows have local_updated and/or github_updated after last_sync, so
+    push, pull and conflict detection all have work to find.
+    """
+    if rng.random() >= args.sync_fraction:
+        return None
+    last_sync = created + timedelta(minutes=rng.randint(60, 60 * 24 * 30))
+    github_updated = local_updated = last_sync
+    if rng.random() < args.stale_fraction:
+        state = rng.choice(SYNC_STATES)
+        if state in ('local', 'conflict'):
+            local_updated = last_sync + timedelta(minutes=rng.randint(1, 60 * 24 * 7))
+        if state in ('github', 'conflict'):
+            github_updated = last_sync + timedelta(minutes=rng.randint(1, 60 * 24 * 7))
+    return last_sync, github_updated, local_updated
+
+
+def epic_status(task_statuses):
+    if all(s == 'completed' for s in task_statuses):
+        return 'completed'
+    if any(s in ('completed', 'in_progress') for s in task_statuses):
+        return 'in_progress'
+    if 'ready' in task_statuses:
+        return 'ready'
+    return 'planning'
+
+
+def task_description(rng, area):
+    files = ', '.join(f'src/{area}/{rng.choice(NOUNS).replace(" ", "_")}.py'
+                      for _ in range(rng.randint(1, 3)))
+    return f'Touches {files}. Acceptance criteria tracked in the epic.'
+
+
+def timestamp(moment):
+    return moment.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def init_schema(db_path):
+    if not SCHEMA_PATH.exists():
+        raise FileNotFoundError(f'Schema not found: {SCHEMA_PATH}')
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executescript(SCHEMA_PATH.read_text())
+    finally:
+        conn.close()
+
+
+def generate(db, args, log=print):
+    """Load the dataset described by ``args`` into ``db``; returns row counts."""
+    rng = random.Random(args.seed)
+    base = datetime.now() - timedelta(days=90)
+    counts = {'prds': 0, 'epics': 0, 'tasks': 0, 'dependencies': 0,
+              'conflicts': 0, 'sync_rows': 0, 'stale_sync_rows': 0}
+
+    for e in range(args.epics):
+        name = f'{args.prefix}-{e:05d}'
+        title = f'{rng.choice(VERBS)} {rng.choice(NOUNS)} ({e})'
+        dep_plan = plan_dependencies(rng, args.tasks_per_epic, args)
+        statuses = plan_statuses(rng, args.tasks_per_epic, dep_plan)
+
+        db.create_prd(name=name, title=title,
+                      content=f'## Overview\nGenerated PRD {e} for scale testing.',
+                      status='approved')
+        db.create_epic(name=name, title=title,
+                       description=f'Generated epic {e} for scale testing',
+                       status=epic_status(statuses))
+        counts['prds'] += 1
+        counts['epics'] += 1
+
+        epic_id = db.execute("SELECT id FROM epics WHERE name = ?", (name,)).fetchone()[0]
+
+        rows = []
+        sync_plan = {}
+        for n, status in enumerate(statuses, start=1):
+            area = rng.choice(AREAS)
+            created = base + timedelta(minutes=e * 60 + n)
+            updated = created
+            sync = plan_sync(rng, created, args)
+            if sync:
+                sync_plan[n - 1] = sync
+                # A local edit after the last sync is what push looks for
+                last_sync, _, local_updated = sync
+                if local_updated > last_sync:
+                    updated = local_updated
+            rows.append((epic_id, n, f'{rng.choice(VERBS)} {area} {rng.choice(NOUNS)}',
+                         task_description(rng, area), status,
+                         timestamp(created), timestamp(updated)))
+
+        # One transaction per epic keeps the journal small at 100k tasks
+        with db.conn:
+            db.conn.executemany("""
+                INSERT INTO tasks (epic_id, number, title, description, status, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            task_ids = [row[0] for row in db.conn.execute(
+                "SELECT id FROM tasks WHERE epic_id = ? ORDER BY number", (epic_id,))]
+
+            deps = sorted((task_ids[i], task_ids[d])
+                          for i, targets in dep_plan.items() for d in targets)
+            db.conn.executemany(
+                "INSERT INTO task_dependencies (task_id, depends_on_task_id) VALUES (?, ?)",
+                deps)
+
+            conflicts = set()
+            if len(task_ids) > 1:
+                for task_id in task_ids:
+                    if rng.random() < args.conflict_density:
+                        other = rng.choice(task_ids)
+                        if other != task_id:
+                            conflicts.add((min(task_id, other), max(task_id, other)))
+            db.conn.executemany(
+                "INSERT INTO task_conflicts (task_id, conflicts_with_task_id) VALUES (?, ?)",
+                sorted(conflicts))
+
+            sync_rows = [('task', task_ids[i]) + tuple(timestamp(t) for t in sync)
+                         for i, sync in sorted(sync_plan.items())]
+            db.conn.executemany("""
+                INSERT INTO sync_metadata (entity_type, entity_id, last_sync, github_updated, local_updated)
+                VALUES (?, ?, ?, ?, ?)
+            """, sync_rows)
+
+        counts['tasks'] += len(task_ids)
+        counts['dependencies'] += len(deps)
+        counts['conflicts'] += len(conflicts)
+        counts['sync_rows'] += len(sync_rows)
+        counts['stale_sync_rows'] += sum(1 for last, gh, local in sync_plan.values()
+                                         if gh > last or local > last)
+
+        if log and (e + 1) % max(1, args.epics // 10) == 0:
+            log(f"  {e + 1}/{args.epics} epics, {counts['tasks']} tasks")
+
+    return counts
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if HELPERS_DIR is None:
+        print(f"❌ Not found: {PROJECT_ROOT / 'lib' / 'python' / 'helpers.py'}", file=sys.stderr)
+        return 1
+    sys.path.insert(0, str(HELPERS_DIR))
+    from helpers import get_db
+
+    if args.init_schema:
+        if not args.db:
+            print("❌ --init-schema requires --db or CCPM_DB_PATH", file=sys.stderr)
+            return 1
+        init_schema(args.db)
+
+    db = get_db(args.db) if args.db else get_db()
+
+    log = None if args.quiet else print
+    if log:
+        log(f"Generating {args.epics} epics x {args.tasks_per_epic} tasks "
+            f"(deps={args.dep_density}, conflicts={args.conflict_density}, seed={args.seed})")
+
+    start = time.perf_counter()
+    try:
+        counts = generate(db, args, log=log)
+    except sqlite3.IntegrityError as e:
+        print(f"❌ {e} (is '{args.prefix}' data already loaded? try --prefix)", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Loaded {counts['prds']} PRDs, {counts['epics']} epics, {counts['tasks']} tasks, "
+          f"{counts['dependencies']} dependencies, {counts['conflicts']} conflicts, "
+          f"{counts['sync_rows']} sync rows ({counts['stale_sync_rows']} stale) in {elapsed:.1f}s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())